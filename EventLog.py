@@ -0,0 +1,198 @@
+from typing import Dict, Optional, IO
+from threading import Thread, Condition
+import numpy as np
+import json
+
+'''
+    Severity levels for simulation events, ordered so that a log set to a level
+    records every event at that level or above
+'''
+class EventLevel:
+    DEBUG : int = 10
+    INFO  : int = 20
+    OFF   : int = 100
+
+'''
+    Kinds of records that can appear in the event stream
+'''
+class EventKind:
+    COLLISION  : int = 0
+    END_OF_RUN : int = 1
+    PROGRESS   : int = 2
+    DROPPED    : int = 3
+
+    NAMES : Dict[int, str] = {COLLISION: 'collision', END_OF_RUN: 'end_of_run', PROGRESS: 'progress', DROPPED: 'dropped'}
+
+EventRecord = np.dtype([('kind',     np.uint8),
+                        ('level',    np.uint8),
+                        ('step',     np.int64),
+                        ('time',     np.float64),
+                        ('particle', np.int32),
+                        ('boundary', np.int32),
+                        ('x',        np.float64),
+                        ('y',        np.float64),
+                        ('theta',    np.float64)])
+
+'''
+    Structured event log for the simulation loop
+
+    Events are written into a fixed-size ring of EventRecord entries and drained to disk by a
+    background writer thread, so the step loop never blocks on file I/O.
+    Events below the configured level return before touching the buffer.
+    If the writer falls behind and the ring fills up, new events are dropped and counted;
+    the count is written as a final DROPPED record (stored in the 'step' field) when the log closes.
+    If the writer fails, the error is raised from close().
+
+    Output formats:
+        - 'jsonl': one JSON object per line
+        - 'bin'  : raw EventRecord entries, readable with np.fromfile(path, dtype=EventRecord)
+'''
+class EventLog:
+    _level      : int              = EventLevel.OFF
+    _path       : str              = None
+    _out        : IO               = None
+    _error      : Exception        = None
+    _fmt        : str              = 'jsonl'
+    _buffer     : np.ndarray       = None
+    _head       : int              = 0
+    _count      : int              = 0
+    _dropped    : int              = 0
+    _flush_at   : int              = 0
+    _closed     : bool             = False
+    _cond       : Condition        = None
+    _writer     : Optional[Thread] = None
+
+    def __init__(self, path: str = None, level: int = EventLevel.OFF, capacity: int = 4096, fmt: str = 'jsonl'):
+        assert fmt in ('jsonl', 'bin')
+        assert capacity > 0
+        self._path  = path
+        self._fmt   = fmt
+        self._level = level if path is not None else EventLevel.OFF
+        if self._level >= EventLevel.OFF:
+            return
+
+        # Open on the caller's thread so a bad path fails here instead of inside the writer
+        self._out      = open(path, 'w' if fmt == 'jsonl' else 'wb')
+        self._buffer   = np.zeros(capacity, dtype=EventRecord)
+        self._flush_at = max(1, capacity // 2)
+        self._cond     = Condition()
+        self._writer   = Thread(target=self._drain, name='EventLogWriter', daemon=True)
+        self._writer.start()
+
+    def enabled(self, level: int) -> bool:
+        return level >= self._level
+
+    def dropped(self) -> int:
+        return self._dropped
+
+    def collision(self, step: int, time: float, particle: int, boundary: int, x: float, y: float, theta: float):
+        if EventLevel.DEBUG < self._level:
+            return
+        self._push(EventKind.COLLISION, EventLevel.DEBUG, step, time, particle, boundary, x, y, theta)
+
+    '''
+        Final state of a particle when the run stops; not an outlet crossing
+    '''
+    def end_of_run(self, step: int, time: float, particle: int, x: float, y: float):
+        if EventLevel.INFO < self._level:
+            return
+        self._push(EventKind.END_OF_RUN, EventLevel.INFO, step, time, particle, -1, x, y, 0.0)
+
+    def progress(self, step: int, time: float):
+        if EventLevel.INFO < self._level:
+            return
+        self._push(EventKind.PROGRESS, EventLevel.INFO, step, time, -1, -1, 0.0, 0.0, 0.0)
+
+    '''
+        Stop accepting events, wait for the writer to drain the ring, and close the output file
+        Must not be called from a signal handler, since the interrupted thread may hold the ring lock
+    '''
+    def close(self):
+        if self._writer is None:
+            return
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._writer.join()
+        self._writer = None
+        if self._error is not None:
+            raise RuntimeError(f'Event log writer for {self._path} failed') from self._error
+
+    def _push(self, kind: int, level: int, step: int, time: float, particle: int, boundary: int, x: float, y: float, theta: float):
+        with self._cond:
+            if self._closed:
+                return
+            capacity = len(self._buffer)
+            if self._count == capacity:
+                self._dropped += 1
+                return
+            self._buffer[(self._head + self._count) % capacity] = (kind, level, step, time, particle, boundary, x, y, theta)
+            self._count += 1
+            if self._count == self._flush_at:
+                self._cond.notify()
+
+    '''
+        Copy pending records out of the ring, called with the condition held
+    '''
+    def _take(self) -> np.ndarray:
+        capacity = len(self._buffer)
+        end = self._head + self._count
+        if end <= capacity:
+            records = self._buffer[self._head:end].copy()
+        else:
+            records = np.concatenate((self._buffer[self._head:], self._buffer[:end - capacity]))
+        self._head  = end % capacity
+        self._count = 0
+        return records
+
+    def _drain(self):
+        try:
+            while True:
+                with self._cond:
+                    while (self._count < self._flush_at) and (not self._closed):
+                        # Wake periodically so a slow trickle of events still reaches disk
+                        if not self._cond.wait(timeout=0.5):
+                            break
+                    records = self._take() if self._count > 0 else None
+                    done = self._closed and (records is None)
+
+                if records is not None:
+                    self._write(self._out, records)
+                if done:
+                    break
+
+            # No more pushes are accepted once closed, so the count is final here
+            if self._dropped > 0:
+                summary = np.array([(EventKind.DROPPED, EventLevel.INFO, self._dropped, 0.0, -1, -1, 0.0, 0.0, 0.0)], dtype=EventRecord)
+                self._write(self._out, summary)
+        except Exception as e:
+            self._error = e
+            # Stop accepting events so producers don't keep filling a ring nobody drains
+            with self._cond:
+                self._closed = True
+        finally:
+            self._out.close()
+
+    def _write(self, out, records: np.ndarray):
+        if self._fmt == 'bin':
+            records.tofile(out)
+            out.flush()
+            return
+
+        lines = []
+        for r in records:
+            kind = int(r['kind'])
+            if kind == EventKind.DROPPED:
+                lines.append(json.dumps({'event': EventKind.NAMES[kind], 'count': int(r['step'])}))
+                continue
+            entry = {'event': EventKind.NAMES[kind], 'step': int(r['step']), 'time': float(r['time'])}
+            if kind != EventKind.PROGRESS:
+                entry['particle'] = int(r['particle'])
+                entry['x'] = float(r['x'])
+                entry['y'] = float(r['y'])
+            if kind == EventKind.COLLISION:
+                entry['boundary'] = int(r['boundary'])
+                entry['theta'] = float(r['theta'])
+            lines.append(json.dumps(entry))
+        out.write('\n'.join(lines) + '\n')
+        out.flush()
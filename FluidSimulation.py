@@ -2,13 +2,13 @@ from Simulation import Simulation, Boundary, BoundaryFunction
 from Fluid import Fluid
 from Particle import Particle
 from Vec import Vec2
+from EventLog import EventLog, EventLevel
 
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import List, Dict, Tuple, Type
 from math import pi, tan, atan
 from time import time, sleep
-import sys
 
 '''
     Main simulation object that represents a particle submersed in a flowing fluid
@@ -29,11 +29,13 @@ class ParticleInFluidSimulation(Simulation):
     _fluid              : Fluid                   = None
     _quit               : bool                    = False
     _elapsed_time       : float                   = 0
+    _start_time         : float                   = 0
     _sec_per_tick       : int                     = None
     _particle_positions : List[List[List[float]]] = None
     _num_iterations     : float                   = None
     _granularity        : float                   = 0.01
     _num_updates        : float                   = 0
+    _events             : EventLog                = None
 
     def create_boundary() -> Boundary:
         cotan = lambda theta : 1.0/np.tan(theta)
@@ -80,7 +82,9 @@ class ParticleInFluidSimulation(Simulation):
         self._boundary = ParticleInFluidSimulation.create_boundary()
         self._fluid = Fluid(fluid_velocity, fluid_density, self._boundary)
         self._elapsed_time = time()
+        self._start_time = self._elapsed_time
         self._particle_positions = []
+        self._events = EventLog()
 
     '''
         Add a particle to the simulation
@@ -104,6 +108,14 @@ class ParticleInFluidSimulation(Simulation):
     def throttle_simulation(self, ticks_per_sec):
         self._sec_per_tick = 1.0/ticks_per_sec
 
+    '''
+        Record collision, end-of-run and progress events at or above the given level to a JSONL or binary file.
+        Writing happens on a background thread; with no log enabled, events are discarded immediately
+    '''
+    def enable_event_log(self, path: str, level: int = EventLevel.INFO, fmt: str = 'jsonl'):
+        self._events.close()
+        self._events = EventLog(path, level=level, fmt=fmt)
+
     def limit_iterations(self, iters: int):
         self._num_iterations = iters
 
@@ -119,11 +131,30 @@ class ParticleInFluidSimulation(Simulation):
             self._particle_positions[i][0].append(pos[0])
             self._particle_positions[i][1].append(pos[1])
 
+    '''
+        Simulated time since the simulation object was created
+    '''
+    def sim_time(self) -> float:
+        return self._elapsed_time - self._start_time
+
+    def interrupted(self) -> bool:
+        return self._quit
+
+    def log_end_of_run(self):
+        for i, p in enumerate(self._particles):
+            pos = p.position()
+            self._events.end_of_run(self._num_updates, self.sim_time(), i, pos[0], pos[1])
+
     def update(self, dt):
-        for p in self._particles:
+        # Count the step up front so every event logged during it carries the same step and time
+        self._num_updates +=1
+        self._elapsed_time += dt
+
+        for i, p in enumerate(self._particles):
             p.update(dt)
             if p.collided():
-                print("Collision")
+                boundary_idx, (x, y, theta) = p.last_collision()
+                self._events.collision(self._num_updates, self.sim_time(), i, boundary_idx, x, y, theta)
                 #Simulate 200 more timesteps to see where it goes
         self._fluid.update(dt)
 
@@ -131,11 +162,12 @@ class ParticleInFluidSimulation(Simulation):
         #     print(f'Position at time_step {self.num_updates}: {p.position()}')
 
         self.update_particle_trajectory()
-        self._num_updates +=1
-        self._elapsed_time += dt
 
         if self._num_updates % 1000 == 0:
-            print(f'{(self._num_updates//1000)*1000} time steps complete')
+            if self._events.enabled(EventLevel.INFO):
+                self._events.progress(self._num_updates, self.sim_time())
+            else:
+                print(f'{(self._num_updates//1000)*1000} time steps complete')
 
     '''
         Get next time step; Note this is a raw time step.
@@ -149,15 +181,20 @@ class ParticleInFluidSimulation(Simulation):
 
     '''
         Start simulation loop
+        The event log is flushed and closed even if an update raises
     '''
     def start(self):
         print("Sim start")
         dt = self.get_time() - self._elapsed_time
-        while (not self._quit) and (self._num_iterations > 0 if (self._num_iterations is not None) else True):
-            self.update(dt)
-            dt = self.get_time() - self._elapsed_time
-            if self._num_iterations is not None:
-                self._num_iterations-=1
+        try:
+            while (not self._quit) and (self._num_iterations > 0 if (self._num_iterations is not None) else True):
+                self.update(dt)
+                dt = self.get_time() - self._elapsed_time
+                if self._num_iterations is not None:
+                    self._num_iterations-=1
+        finally:
+            self.log_end_of_run()
+            self._events.close()
 
     def plot_boundary(self):
         markers = ['r+', 'b+', 'y+', 'y+']
@@ -175,9 +212,12 @@ class ParticleInFluidSimulation(Simulation):
 
         plt.show()
 
+    '''
+        SIGINT handler that stops the simulation loop; start() then flushes the event log
+        and returns so the trajectories can be plotted. Check interrupted() afterwards to exit non-zero
+    '''
     def get_sig_handler(self):
         def handler(sig, frame):
             print("This is an early exit, will plot trajectories at this point")
-            self.plot()
-            sys.exit(1)
+            self._quit = True
         return handler
\ No newline at end of file
@@ -25,6 +25,7 @@ class Particle(Simulation):
     _fluid    : Fluid = None
     _get_reynolds : SimulationParameterFunc
     _get_drag_coeff : SimulationParameterFunc
+    _collision : Tuple[int, Tuple[float, float, float]] = None
 
     def __init__(self,
                  p: Vec2,
@@ -60,6 +61,12 @@ class Particle(Simulation):
     def collided(self) -> bool:
         return self._collided
 
+    '''
+        Boundary index and LUT entry (x, y, theta) of the collision in the last update, if any
+    '''
+    def last_collision(self) -> Tuple[int, Tuple[float, float, float]]:
+        return self._collision
+
     def reflect_off_boundary(self, boundary_idx: int, collision_theta: Tuple, dt: float):
         normal: Vec2 = self._fluid.boundary_functions()[boundary_idx].get_normal_at_point(collision_theta)
 
@@ -80,13 +87,13 @@ class Particle(Simulation):
         for i, f in enumerate(self._fluid.boundary_functions()):
             collision = f.call_inv(self._position[0], self._position[1])
             if collision is not None:
-                print("Boundary", i, ":: ")
-                print(collision)
+                self._collision = (i, collision)
                 self.reflect_off_boundary(i, collision[2], dt)
                 return
 
     def update(self, dt: float):
         self._collided         = False
+        self._collision        = None
         drag_force      : Vec2 = Vec2.zeros()
         delta_velocity  : Vec2 = Vec2.zeros()
 
@@ -1,14 +1,16 @@
 from FluidSimulation import ParticleInFluidSimulation
 from Simulation import PhysicsConstants
+from EventLog import EventLevel
 from tests.BoundaryTest import plot_boundary_funcs, get_inlet_outlet_areas
 from tests.TestReynoldsNumber import run_reynolds_test, run_drag_coeff_test
+from tests.TestEventLog import run_event_log_test
 from Vec import Vec2
 import sys
 import numpy as np
 import signal
 
 def main():
-    if ((len(sys.argv) > 1)):
+    if ((len(sys.argv) > 1) and (sys.argv[1] != 'log_events')):
         if sys.argv[1] == 'test_boundary':
             plot_boundary_funcs()
         if sys.argv[1] == 'get_wall_areas':
@@ -17,6 +19,8 @@ def main():
             run_reynolds_test()
         if sys.argv[1] == 'test_drag_coeff':
             run_drag_coeff_test()
+        if sys.argv[1] == 'test_event_log':
+            run_event_log_test()
     else:
 
         sim = ParticleInFluidSimulation(fluid_velocity=Vec2(1.0, 0.0), fluid_density=PhysicsConstants.DENSITY_AIR_25C__1_ATM)
@@ -44,9 +48,16 @@ def main():
 
         sim.throttle_simulation(1000)
         sim.limit_iterations(20000)
+        # Opt-in: python3 main.py log_events [path] [debug|info]
+        if len(sys.argv) > 1:
+            path  = sys.argv[2] if len(sys.argv) > 2 else 'sim_events.jsonl'
+            level = {'debug': EventLevel.DEBUG, 'info': EventLevel.INFO}[sys.argv[3] if len(sys.argv) > 3 else 'info']
+            sim.enable_event_log(path, level=level)
 
         sim.start()
         sim.plot()
+        if sim.interrupted():
+            sys.exit(1)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
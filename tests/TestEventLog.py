@@ -0,0 +1,144 @@
+from EventLog import EventLog, EventLevel, EventKind, EventRecord
+from threading import Thread, Event
+import numpy as np
+import tempfile
+import json
+import os
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+'''
+    Run close() on a helper thread so a hang shows up as a failure instead of blocking the test run
+'''
+def close_with_timeout(log, timeout=5.0):
+    errors = []
+    def target():
+        try:
+            log.close()
+        except Exception as e:
+            errors.append(e)
+    t = Thread(target=target, daemon=True)
+    t.start()
+    t.join(timeout)
+    assert not t.is_alive() and "close() did not return"
+    return errors
+
+def check_jsonl_output(path):
+    log = EventLog(path, level=EventLevel.DEBUG, capacity=64)
+    for step in range(20):
+        log.collision(step, step*0.01, 0, 1, 0.5, -0.25, 1.2)
+    log.progress(1000, 10.0)
+    log.end_of_run(1001, 10.01, 0, 8.0, 0.1)
+    log.close()
+
+    events = read_jsonl(path)
+    kinds = [e['event'] for e in events]
+    print(f'jsonl: {len(events)} written (expected 22)')
+    assert len(events) == 22
+    assert kinds == ['collision']*20 + ['progress', 'end_of_run']
+    assert (events[0]['boundary'] == 1) and (events[-1]['x'] == 8.0)
+
+def check_full_ring_drops(path):
+    log = EventLog(path, level=EventLevel.DEBUG, capacity=8)
+    for step in range(1000):
+        log.collision(step, step*0.01, 0, 1, 0.5, -0.25, 1.2)
+    log.close()
+
+    events = read_jsonl(path)
+    written = len(events) - 1
+    print(f'full ring: {written} written, {log.dropped()} dropped (expected total 1000)')
+    assert log.dropped() > 0
+    assert written + log.dropped() == 1000
+    assert events[-1] == {'event': 'dropped', 'count': log.dropped()}
+
+def check_level_filtering(path):
+    log = EventLog(path, level=EventLevel.INFO)
+    log.collision(0, 0.0, 0, 1, 0.5, -0.25, 1.2)
+    log.progress(1000, 10.0)
+    log.close()
+
+    events = read_jsonl(path)
+    print(f'level filtering: {[e["event"] for e in events]} (expected [\'progress\'])')
+    assert [e['event'] for e in events] == ['progress']
+
+def check_binary_output(path):
+    log = EventLog(path, level=EventLevel.DEBUG, fmt='bin')
+    log.collision(5, 0.05, 2, 3, 1.0, 2.0, 0.5)
+    log.close()
+
+    records = np.fromfile(path, dtype=EventRecord)
+    print(f'binary: {len(records)} records, boundary {records[0]["boundary"]} (expected 1 record, boundary 3)')
+    assert (len(records) == 1) and (records[0]['boundary'] == 3)
+
+def check_close_while_busy(path):
+    log = EventLog(path, level=EventLevel.DEBUG, capacity=64)
+    started = Event()
+    def produce():
+        for step in range(20000):
+            log.collision(step, step*0.01, 0, 1, 0.5, -0.25, 1.2)
+            started.set()
+    producer = Thread(target=produce)
+    producer.start()
+    started.wait()
+    errors = close_with_timeout(log)
+    producer.join()
+
+    events = read_jsonl(path)
+    collisions = [e for e in events if e['event'] == 'collision']
+    dropped = [e['count'] for e in events if e['event'] == 'dropped']
+    print(f'close while busy: {len(collisions)} written, {log.dropped()} dropped, errors {errors} (expected no errors)')
+    assert errors == []
+    assert len(collisions) > 0
+    assert len(collisions) + log.dropped() <= 20000
+    assert dropped == ([log.dropped()] if log.dropped() > 0 else [])
+    # Records are written in push order, so steps must be strictly increasing
+    steps = [e['step'] for e in collisions]
+    assert steps == sorted(set(steps))
+
+def check_close_twice(path):
+    log = EventLog(path, level=EventLevel.DEBUG)
+    log.progress(1000, 10.0)
+    log.close()
+    errors = close_with_timeout(log)
+    log.progress(2000, 20.0)
+
+    events = read_jsonl(path)
+    print(f'close twice: {len(events)} written, errors {errors} (expected 1 written, no errors)')
+    assert (len(events) == 1) and (errors == [])
+
+def check_bad_path(path):
+    try:
+        EventLog(os.path.join(path, 'missing', 'events.jsonl'), level=EventLevel.DEBUG)
+    except FileNotFoundError:
+        print('bad path: FileNotFoundError raised (expected)')
+        return
+    assert False and "bad path did not raise"
+
+def check_writer_failure(path):
+    log = EventLog(path, level=EventLevel.DEBUG)
+    # A kind with no name makes the JSONL writer fail
+    log._push(len(EventKind.NAMES), EventLevel.DEBUG, 0, 0.0, -1, -1, 0.0, 0.0, 0.0)
+    errors = close_with_timeout(log)
+    print(f'writer failure: {[type(e).__name__ for e in errors]} (expected [\'RuntimeError\'])')
+    assert (len(errors) == 1) and isinstance(errors[0], RuntimeError)
+
+def check_disabled_log():
+    log = EventLog()
+    log.collision(0, 0.0, 0, 1, 0.5, -0.25, 1.2)
+    log.close()
+    print(f'disabled: enabled(DEBUG) = {log.enabled(EventLevel.DEBUG)} (expected False)')
+    assert not log.enabled(EventLevel.DEBUG)
+
+def run_event_log_test():
+    with tempfile.TemporaryDirectory() as tmp:
+        check_jsonl_output(os.path.join(tmp, 'events.jsonl'))
+        check_full_ring_drops(os.path.join(tmp, 'drops.jsonl'))
+        check_level_filtering(os.path.join(tmp, 'filtered.jsonl'))
+        check_binary_output(os.path.join(tmp, 'events.bin'))
+        check_close_while_busy(os.path.join(tmp, 'busy.jsonl'))
+        check_close_twice(os.path.join(tmp, 'twice.jsonl'))
+        check_bad_path(tmp)
+        check_writer_failure(os.path.join(tmp, 'failure.jsonl'))
+    check_disabled_log()